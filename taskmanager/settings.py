@@ -15,8 +15,11 @@ SECRET_KEY = os.environ.get('SECRET_KEY', 'm-jcq5+63ptwwc1xufy00^6*$w^f%em1)#tqh
 # SECURITY: Debug mode should be False in production
 DEBUG = os.environ.get('DEBUG', 'False').lower() == 'true'
 
-# Add your Render domain and any other production domains
-ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '127.0.0.1,localhost').split(',')
+# Add your Render domain and any other production domains.
+# Single env lookup and one pass: split, strip, and drop empties (a
+# trailing comma would otherwise yield an invalid '' host entry).
+_allowed_hosts = os.environ.get('ALLOWED_HOSTS', '127.0.0.1,localhost')
+ALLOWED_HOSTS = [h.strip() for h in _allowed_hosts.split(',') if h.strip()]
 
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -74,6 +77,23 @@ if dj_database_url and 'DATABASE_URL' in os.environ:
         conn_health_checks=True,
     )
 
+# Keep DB connections open between requests instead of paying the
+# connect/teardown cost every time. Applied unconditionally so the
+# setting holds even when DATABASES is configured without dj_database_url.
+# (For very high concurrency, front Postgres with pgbouncer in
+# transaction-pooling mode and point DATABASE_URL at it.)
+DATABASES['default']['CONN_MAX_AGE'] = 600
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Cache backend for template fragment caching (dashboard project cards).
+# LocMemCache is fine for a single worker; point this at Redis when
+# running multiple workers so they share fragments.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -91,8 +111,17 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'tasks' / 'static']
 
-# Enable WhiteNoise for static files
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Enable WhiteNoise for static files. Django 5.1 dropped the old
+# STATICFILES_STORAGE setting, so the storage has to go through STORAGES
+# or collectstatic silently skips compression/hashing. With the brotli
+# package installed WhiteNoise serves .br variants automatically.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+}
+
+# Far-future caching for any static file served without a manifest hash
+WHITENOISE_MAX_AGE = 31536000  # 1 year
 
 # Auth redirects
 LOGIN_URL = '/login/'
@@ -9,9 +9,17 @@ class ProjectAdmin(admin.ModelAdmin):
     search_fields = ('name', 'manager__username')
     ordering = ('-created_at',)
 
+    def get_queryset(self, request):
+        # JOIN managers so list_display doesn't query per row
+        return super().get_queryset(request).select_related('manager')
+
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ('title', 'project', 'assigned_to', 'status', 'due_date', 'created_at')
     list_filter = ('status', 'project', 'assigned_to')
     search_fields = ('title', 'project__name', 'assigned_to__username')
     ordering = ('-created_at',)
+
+    def get_queryset(self, request):
+        # JOIN project and assignee so list_display doesn't query per row
+        return super().get_queryset(request).select_related('project', 'assigned_to')
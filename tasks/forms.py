@@ -1,4 +1,7 @@
 from django import forms
+from django.contrib.auth.models import User
+from django.db.models import Q
+
 from .models import Project, Task
 
 class ProjectForm(forms.ModelForm):
@@ -7,8 +10,29 @@ class ProjectForm(forms.ModelForm):
         # keep fields minimal to avoid unknown-field errors
         fields = ['name', 'description', 'manager']  # manager should be FK to User
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Only plausible managers (same rule as get_user_flags), and only
+        # the columns the <select> renders — not every full User row
+        self.fields['manager'].queryset = (
+            User.objects.filter(
+                Q(groups__name__in=['Admin', 'Manager']) | Q(is_staff=True) | Q(is_superuser=True)
+            )
+            .only('id', 'username')
+            .distinct()
+            .order_by('username')
+        )
+
 class TaskForm(forms.ModelForm):
     class Meta:
         model = Task
         # include safe/common fields only
         fields = ['title', 'description', 'assigned_to']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Active users only, id/username columns only — keeps the select
+        # cheap even with a large auth_user table
+        self.fields['assigned_to'].queryset = (
+            User.objects.filter(is_active=True).only('id', 'username').order_by('username')
+        )
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-08-26 10:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_project_updated_at_task_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='project',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['manager', '-created_at'], name='tasks_proje_manager_08b7c1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assigned_to', '-created_at'], name='tasks_task_assigne_f1b4bb_idx'),
+        ),
+    ]
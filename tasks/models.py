@@ -13,7 +13,15 @@ class Project(models.Model):
         blank=True,
         related_name='projects'
     )
-    created_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # Lets the manager-dashboard branch filter and order in one scan
+            models.Index(fields=['manager', '-created_at']),
+        ]
 
     def __str__(self):
         return self.name
@@ -29,9 +37,19 @@ class Task(models.Model):
     description = models.TextField(blank=True)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='tasks')
     assigned_to = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='tasks')
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='todo')
-    due_date = models.DateField(null=True, blank=True)
-    created_at = models.DateTimeField(default=timezone.now)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='todo', db_index=True)
+    due_date = models.DateField(null=True, blank=True, db_index=True)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # Supports the admin's combined project/status filter
+            models.Index(fields=['project', 'status']),
+            # Lets per-user task lookups filter and order in one scan
+            models.Index(fields=['assigned_to', '-created_at']),
+        ]
 
     def __str__(self):
         return self.title